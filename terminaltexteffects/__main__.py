@@ -5,6 +5,7 @@ import importlib
 import importlib.metadata
 import pkgutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import terminaltexteffects.effects
 import terminaltexteffects.engine.terminal as term
@@ -12,7 +13,37 @@ from terminaltexteffects.engine.terminal import TerminalConfig
 from terminaltexteffects.utils.argsdataclass import ArgsDataClass
 
 
-def main():
+def get_effect_module_names() -> dict[str, str]:
+    """Get the command name and module name of each effect without importing the effect modules.
+
+    Effect modules are named effect_<command>, with any underscores removed from the command name.
+
+    Returns:
+        dict[str, str]: mapping of effect command names to fully qualified module names
+    """
+    effect_module_names = {}
+    for module_info in pkgutil.iter_modules(
+        terminaltexteffects.effects.__path__, terminaltexteffects.effects.__name__ + "."
+    ):
+        module_name = module_info.name.rsplit(".", 1)[-1]
+        if module_name.startswith("effect_"):
+            effect_module_names[module_name[len("effect_") :].replace("_", "")] = module_info.name
+    return effect_module_names
+
+
+def build_parser(effect_module_names: dict[str, str], requested_effect: str | None) -> argparse.ArgumentParser:
+    """Build the argument parser. Only the requested effect module is imported and given its full set of arguments.
+    The remaining effects are registered as placeholder subparsers without arguments. If no effect is requested, all
+    effect modules are imported so the help output lists every effect. If the requested effect module registers a
+    command name other than the name derived from the module name, all effect modules are imported.
+
+    Args:
+        effect_module_names (dict[str, str]): mapping of effect command names to module names
+        requested_effect (str | None): command name of the effect to load, or None to load all effects
+
+    Returns:
+        argparse.ArgumentParser: the argument parser
+    """
     parser = (argparse.ArgumentParser)(
         prog="tte",
         description="A terminal visual effects engine, application, and library",
@@ -36,16 +67,48 @@ def main():
         required=True,
     )
 
-    for module_info in pkgutil.iter_modules(
-        terminaltexteffects.effects.__path__, terminaltexteffects.effects.__name__ + "."
-    ):
-        module = importlib.import_module(module_info.name)
+    if requested_effect is not None:
+        effect_class, args_class = importlib.import_module(effect_module_names[requested_effect]).get_effect_and_args()
+        if args_class.arg_class_metadata.name != requested_effect:
+            # the module name does not match the effect command name, fall back to loading every effect
+            requested_effect = None
+
+    for effect_name, module_name in effect_module_names.items():
+        if requested_effect is None or effect_name == requested_effect:
+            module = importlib.import_module(module_name)
+
+            if hasattr(module, "get_effect_and_args"):
+                effect_class, args_class = module.get_effect_and_args()
+                args_class._add_to_args_subparsers(subparsers)
+        else:
+            placeholder_parser = subparsers.add_parser(effect_name, add_help=False)
+            placeholder_parser.set_defaults(unloaded_effect=effect_name)
 
-        if hasattr(module, "get_effect_and_args"):
-            effect_class, args_class = module.get_effect_and_args()
-            args_class._add_to_args_subparsers(subparsers)
+    return parser
 
-    args = parser.parse_args()
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments, importing only the effect module selected on the command line.
+
+    Returns:
+        argparse.Namespace: the parsed arguments
+    """
+    effect_module_names = get_effect_module_names()
+    # the effect name is found without parsing so only the selected effect module needs to be imported
+    requested_effect = next((arg for arg in sys.argv[1:] if arg in effect_module_names), None)
+    parser = build_parser(effect_module_names, requested_effect)
+    args, unrecognized_args = parser.parse_known_args()
+    if getattr(args, "unloaded_effect", None):
+        # an argument value matched an effect name before the selected effect, rebuild with the selected effect
+        parser = build_parser(effect_module_names, args.unloaded_effect)
+        args = parser.parse_args()
+    elif unrecognized_args:
+        parser.error(f"unrecognized arguments: {' '.join(unrecognized_args)}")
+    return args
+
+
+def main():
+    args = parse_args()
     if args.input_file:
         try:
             with open(args.input_file, "r", encoding="UTF-8") as f:
@@ -69,9 +132,15 @@ def main():
         effect.effect_config = effect_config
         effect.terminal_config = terminal_config
         try:
-            with effect.terminal_output() as terminal:
+            # frames are printed by a worker thread so the next frame is computed while the previous frame is written
+            with effect.terminal_output() as terminal, ThreadPoolExecutor(max_workers=1) as print_executor:
+                pending_print: Future | None = None
                 for frame in effect:
-                    terminal.print(frame)
+                    if pending_print:
+                        pending_print.result()
+                    pending_print = print_executor.submit(terminal.print, frame)
+                if pending_print:
+                    pending_print.result()
         except KeyboardInterrupt:
             sys.exit(1)
 
@@ -196,7 +196,7 @@ class DecryptIterator(BaseEffectIterator[DecryptConfig]):
                 self.update()
                 return self.frame
             else:
-                self.active_characters = self.decrypting_pending_chars
+                self.active_characters = self.decrypting_pending_chars.copy()
                 for char in self.active_characters:
                     char.animation.activate_scene(char.animation.query_scene("fast_decrypt"))
                 self.phase = "decrypting"
@@ -9,12 +9,14 @@ Classes:
 
 from __future__ import annotations
 
+import itertools
 import random
 import typing
 from dataclasses import dataclass
+from operator import attrgetter
 
 import terminaltexteffects.utils.argvalidators as argvalidators
-from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.utils import easing
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, argclass
@@ -131,7 +133,8 @@ class RainIterator(BaseEffectIterator[RainConfig]):
     def __init__(self, effect: "Rain") -> None:
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
-        self.group_by_row: dict[int, list[EffectCharacter | None]] = {}
+        self.group_by_row: list[list[EffectCharacter]] = []
+        self.next_row_index = 0
         self.character_final_color_map: dict[EffectCharacter, Color] = {}
         self.build()
 
@@ -140,46 +143,60 @@ class RainIterator(BaseEffectIterator[RainConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
-        for character in self.terminal.get_characters():
+        input_characters = self.terminal.get_characters()
+        for character in input_characters:
             self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
 
-        for character in self.terminal.get_characters():
-            raindrop_color = random.choice(self.config.rain_colors)
+        raindrop_colors = random.choices(self.config.rain_colors, k=len(input_characters))
+        raindrop_symbols = random.choices(self.config.rain_symbols, k=len(input_characters))
+        # characters sharing a raindrop color and final color share a raindrop gradient
+        raindrop_gradient_map: dict[tuple[Color, Color], Gradient] = {}
+        path_complete_event = EventHandler.Event.PATH_COMPLETE
+        activate_scene_action = EventHandler.Action.ACTIVATE_SCENE
+        # the module level functions are bound methods of the shared generator, which keeps random.seed() effective
+        random_uniform = random.uniform
+        min_movement_speed, max_movement_speed = self.config.movement_speed
+        movement_easing = self.config.movement_easing
+        canvas_top = self.terminal.canvas.top
+        for character, raindrop_color, raindrop_symbol in zip(input_characters, raindrop_colors, raindrop_symbols):
             rain_scn = character.animation.new_scene()
-            rain_scn.add_frame(random.choice(self.config.rain_symbols), 1, color=raindrop_color)
-            raindrop_gradient = Gradient(raindrop_color, self.character_final_color_map[character], steps=7)
+            rain_scn.add_frame(raindrop_symbol, 1, color=raindrop_color)
+            final_color = self.character_final_color_map[character]
+            raindrop_gradient = raindrop_gradient_map.get((raindrop_color, final_color))
+            if raindrop_gradient is None:
+                raindrop_gradient = Gradient(raindrop_color, final_color, steps=7)
+                raindrop_gradient_map[(raindrop_color, final_color)] = raindrop_gradient
             fade_scn = character.animation.new_scene()
             fade_scn.apply_gradient_to_symbols(raindrop_gradient, character.input_symbol, 5)
             character.animation.activate_scene(rain_scn)
-            character.motion.set_coordinate(Coord(character.input_coord.column, self.terminal.canvas.top))
+            character.motion.set_coordinate(Coord(character.input_coord.column, canvas_top))
             input_path = character.motion.new_path(
-                speed=random.uniform(self.config.movement_speed[0], self.config.movement_speed[1]),
-                ease=self.config.movement_easing,
+                speed=random_uniform(min_movement_speed, max_movement_speed),
+                ease=movement_easing,
             )
             input_path.new_waypoint(character.input_coord)
 
-            character.event_handler.register_event(
-                character.event_handler.Event.PATH_COMPLETE,
-                input_path,
-                character.event_handler.Action.ACTIVATE_SCENE,
-                fade_scn,
-            )
+            character.event_handler.register_event(path_complete_event, input_path, activate_scene_action, fade_scn)
             character.motion.activate_path(input_path)
-            self.pending_chars.append(character)
-        for character in sorted(self.pending_chars, key=lambda c: c.input_coord.row):
-            if character.input_coord.row not in self.group_by_row:
-                self.group_by_row[character.input_coord.row] = []
-            self.group_by_row[character.input_coord.row].append(character)
-        self.pending_chars.clear()
+        # rows are ordered from the bottom of the canvas to the top
+        get_row = attrgetter("input_coord.row")
+        self.group_by_row = [
+            list(row_characters)
+            for _, row_characters in itertools.groupby(sorted(input_characters, key=get_row), key=get_row)
+        ]
 
     def __next__(self) -> str:
-        if self.group_by_row or self.active_characters or self.pending_chars:
-            if not self.pending_chars and self.group_by_row:
-                self.pending_chars.extend(self.group_by_row.pop(min(self.group_by_row.keys())))  # type: ignore
+        rows_remaining = self.next_row_index < len(self.group_by_row)
+        if rows_remaining or self.active_characters or self.pending_chars:
+            if not self.pending_chars and rows_remaining:
+                self.pending_chars.extend(self.group_by_row[self.next_row_index])
+                self.next_row_index += 1
+                # shuffle once so characters can be taken from the end of the list in random order
+                random.shuffle(self.pending_chars)
             if self.pending_chars:
                 for _ in range(random.randint(1, 3)):
                     if self.pending_chars:
-                        next_character = self.pending_chars.pop(random.randint(0, len(self.pending_chars) - 1))
+                        next_character = self.pending_chars.pop()
                         self.terminal.set_character_visibility(next_character, True)
                         self.active_characters.append(next_character)
 
@@ -10,6 +10,8 @@ from terminaltexteffects.utils import ansitools, colorterm, easing, graphics, he
 if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character
 
+_RESET_ALL = ansitools.RESET_ALL()
+
 
 class SyncMetric(Enum):
     """Enum for specifying the type of sync to use for a Scene.
@@ -85,7 +87,7 @@ class CharacterVisual:
         if self.color is not None:
             formatting_string += colorterm.fg(self.color)
 
-        self.symbol = f"{formatting_string}{self.symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
+        self.symbol = f"{formatting_string}{self.symbol}{_RESET_ALL if formatting_string else ''}"
 
 
 @dataclass
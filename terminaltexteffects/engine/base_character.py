@@ -147,6 +147,10 @@ class EventHandler:
             event (Event): An event to handle. If the event is not registered, nothing happens.
             caller (animation.Scene | motion.Waypoint | motion.Path): The object triggering the call.
         """
+        # most events have no registered actions, so check before building the action map
+        registered_actions = self.registered_events.get((event, caller))
+        if not registered_actions:
+            return
         action_map = {
             EventHandler.Action.ACTIVATE_PATH: self.character.motion.activate_path,
             EventHandler.Action.ACTIVATE_SCENE: self.character.animation.activate_scene,
@@ -157,9 +161,7 @@ class EventHandler:
             EventHandler.Action.CALLBACK: lambda callback: callback.callback(self.character, *callback.args),
         }
 
-        if (event, caller) not in self.registered_events:
-            return
-        for event_action in self.registered_events[(event, caller)]:
+        for event_action in registered_actions:
             action, target = event_action
             action_map[action](target)  # type: ignore
 
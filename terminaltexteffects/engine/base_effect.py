@@ -66,13 +66,19 @@ class BaseEffectIterator(ABC, Generic[T]):
         return self.terminal.get_formatted_output_string()
 
     def update(self) -> None:
-        """Run the tick method for all active characters and remove inactive characters from the active list."""
-        _active_characters = []
-        for character in self.active_characters:
+        """Run the tick method for all active characters and remove inactive characters from the active list.
+
+        The active list is compacted in place to avoid allocating a new list every frame. A list assigned to
+        active_characters is modified by this method, assign a copy if the original list is used elsewhere.
+        """
+        active_characters = self.active_characters
+        active_count = 0
+        for character in active_characters:
             character.tick()
             if character.is_active:
-                _active_characters.append(character)
-        self.active_characters = _active_characters
+                active_characters[active_count] = character
+                active_count += 1
+        del active_characters[active_count:]
 
     def __iter__(self) -> "BaseEffectIterator":
         return self
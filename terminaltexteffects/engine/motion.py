@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import typing
 from dataclasses import dataclass
+from functools import lru_cache
 
 from terminaltexteffects.utils import easing, geometry
 from terminaltexteffects.utils.geometry import Coord
@@ -19,6 +20,22 @@ if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character
 
 
+@lru_cache(maxsize=1024)
+def _get_eased_step_factors(ease: easing.EasingFunction, max_steps: int) -> tuple[float, ...]:
+    """Returns the eased distance factor for each step of a path. Paths with the same easing function and number of
+    steps share the same factors, so the easing function is evaluated once per step count rather than once per step
+    for every character.
+
+    Args:
+        ease (easing.EasingFunction): easing function
+        max_steps (int): number of steps in the path
+
+    Returns:
+        tuple[float, ...]: eased distance factors indexed by step, 0 <= step <= max_steps
+    """
+    return tuple(ease(step / max_steps) for step in range(max_steps + 1))
+
+
 @dataclass
 class Waypoint:
     """A Waypoint comprises a coordinate, speed, and, optionally, bezier control point(s).
@@ -138,6 +155,8 @@ class Path:
         self.hold_time_remaining = self.hold_time
         self.last_distance_reached: float = 0  # used for animation syncing to distance
         self.origin_segment: Segment | None = None
+        self._eased_step_factors: tuple[float, ...] = ()
+        self._eased_step_factors_ease: easing.EasingFunction | None = None
         if self.speed <= 0:
             raise ValueError(f"({self.speed=}) Speed must be greater than 0.")
 
@@ -222,15 +241,20 @@ class Path:
         Returns:
             Coord: The next coordinate on the path.
         """
-        if not self.max_steps or self.current_step >= self.max_steps or not self.total_distance:
+        max_steps = self.max_steps
+        if not max_steps or self.current_step >= max_steps or not self.total_distance:
             # if the path has zero distance or there are no more steps, return the coordinate of the final waypoint in the path
             return self.segments[-1].end.coord
+        self.current_step += 1
+        ease = self.ease
+        if ease:
+            eased_step_factors = self._eased_step_factors
+            if self._eased_step_factors_ease is not ease or len(eased_step_factors) != max_steps + 1:
+                eased_step_factors = self._eased_step_factors = _get_eased_step_factors(ease, max_steps)
+                self._eased_step_factors_ease = ease
+            distance_factor = eased_step_factors[self.current_step]
         else:
-            self.current_step += 1
-        if self.ease:
-            distance_factor = self.ease(self.current_step / self.max_steps)
-        else:
-            distance_factor = self.current_step / self.max_steps
+            distance_factor = self.current_step / max_steps
 
         distance_to_travel = distance_factor * self.total_distance
         self.last_distance_reached = distance_to_travel
@@ -505,28 +529,27 @@ class Motion:
         The character's previous coordinate is preserved before moving to allow for clearing the location in the terminal.
         """
         # preserve previous coordinate to allow for clearing the location in the terminal
-        self.previous_coord = Coord(self.current_coord.column, self.current_coord.row)
+        # Coord is immutable so the current coordinate object can be kept without copying
+        self.previous_coord = self.current_coord
 
-        if not self.active_path or not self.active_path.segments:
+        active_path = self.active_path
+        if not active_path or not active_path.segments:
             return
-        self.current_coord = self.active_path.step(self.character.event_handler)
-        if self.active_path.current_step == self.active_path.max_steps:
-            if self.active_path.hold_time and self.active_path.hold_time_remaining == self.active_path.hold_time:
-                self.character.event_handler._handle_event(
-                    self.character.event_handler.Event.PATH_HOLDING, self.active_path
-                )
-                self.active_path.hold_time_remaining -= 1
+        self.current_coord = active_path.step(self.character.event_handler)
+        if active_path.current_step == active_path.max_steps:
+            if active_path.hold_time and active_path.hold_time_remaining == active_path.hold_time:
+                self.character.event_handler._handle_event(self.character.event_handler.Event.PATH_HOLDING, active_path)
+                active_path.hold_time_remaining -= 1
                 return
-            elif self.active_path.hold_time_remaining:
-                self.active_path.hold_time_remaining -= 1
+            elif active_path.hold_time_remaining:
+                active_path.hold_time_remaining -= 1
                 return
-            if self.active_path.loop and len(self.active_path.segments) > 1:
-                looping_path = self.active_path
-                self.deactivate_path(self.active_path)
-                self.activate_path(looping_path)
+            if active_path.loop and len(active_path.segments) > 1:
+                self.deactivate_path(active_path)
+                self.activate_path(active_path)
             else:
-                self.completed_path = self.active_path
-                self.deactivate_path(self.active_path)
+                self.completed_path = active_path
+                self.deactivate_path(active_path)
                 self.character.event_handler._handle_event(
                     self.character.event_handler.Event.PATH_COMPLETE, self.completed_path
                 )
@@ -8,12 +8,14 @@ Classes:
 
 from __future__ import annotations
 
+import os
 import random
 import shutil
 import sys
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
+from operator import attrgetter
 
 import terminaltexteffects.utils.argvalidators as argvalidators
 from terminaltexteffects.engine.base_character import EffectCharacter
@@ -21,6 +23,14 @@ from terminaltexteffects.utils import ansitools
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass
 from terminaltexteffects.utils.geometry import Coord
 
+# constant ANSI sequences are built once rather than on every write
+_HIDE_CURSOR = ansitools.HIDE_CURSOR()
+_SHOW_CURSOR = ansitools.SHOW_CURSOR()
+_DEC_SAVE_CURSOR_POSITION = ansitools.DEC_SAVE_CURSOR_POSITION()
+_DEC_RESTORE_CURSOR_POSITION = ansitools.DEC_RESTORE_CURSOR_POSITION()
+
+_get_layer = attrgetter("layer")
+
 
 @dataclass
 class TerminalConfig(ArgsDataClass):
@@ -307,6 +317,8 @@ class Terminal:
         self._visible_characters: set[EffectCharacter] = set()
         self._frame_rate = self.config.frame_rate
         self._last_time_printed = time.time()
+        self._last_printed_rows: list[str] = []
+        self._last_rendered_rows: list[list[str]] = []
         self._update_terminal_state()
 
     def _get_terminal_dimensions(self) -> tuple[int, int]:
@@ -334,12 +346,21 @@ class Terminal:
         or if there is piped input. When the program is run interactively, `sys.stdin.isatty()` returns True,
         indicating that there is no piped input. In this case, the method returns an empty string.
 
+        The input is read from the underlying binary buffer in a single call and decoded once, using the encoding
+        of stdin. Invalid byte sequences are replaced rather than raising an error.
+
         Returns:
             str: The piped input from stdin as a string, or an empty string if there is no piped input.
         """
         if sys.stdin.isatty():
             return ""
-        return sys.stdin.read()
+        stdin_buffer = getattr(sys.stdin, "buffer", None)
+        if stdin_buffer is None:
+            return sys.stdin.read()
+        input_data = stdin_buffer.read()
+        if not input_data:
+            return ""
+        return input_data.decode(getattr(sys.stdin, "encoding", None) or "utf-8", errors="replace")
 
     def _wrap_lines(self, lines: list[str]) -> list[str]:
         """
@@ -429,15 +450,28 @@ class Terminal:
     def _update_terminal_state(self):
         """Update the internal representation of the terminal state with the current position
         of all visible characters.
+
+        The symbols rendered in each row are kept between updates and only rows whose symbols have changed are
+        joined into a new row string.
         """
-        rows = [[" " for _ in range(self.canvas.right)] for _ in range(self.canvas.top)]
-        for character in sorted(self._visible_characters, key=lambda c: c.layer):
-            row = character.motion.current_coord.row - 1
-            column = character.motion.current_coord.column - 1
-            if 0 <= row < self.canvas.top and 0 <= column < self.canvas.right:
+        top = self.canvas.top
+        right = self.canvas.right
+        rows = [[" "] * right for _ in range(top)]
+        for character in sorted(self._visible_characters, key=_get_layer):
+            coord = character.motion.current_coord
+            row = coord.row - 1
+            column = coord.column - 1
+            if 0 <= row < top and 0 <= column < right:
                 rows[row][column] = character.symbol
-        terminal_state = ["".join(row) for row in rows]
-        self.terminal_state = terminal_state
+        if len(rows) != len(self._last_rendered_rows):
+            self.terminal_state = ["".join(row) for row in rows]
+        else:
+            terminal_state = list(self.terminal_state)
+            for row_index, (row, last_rendered_row) in enumerate(zip(rows, self._last_rendered_rows)):
+                if row != last_rendered_row:
+                    terminal_state[row_index] = "".join(row)
+            self.terminal_state = terminal_state
+        self._last_rendered_rows = rows
 
     def get_characters(
         self,
@@ -520,25 +554,23 @@ class Terminal:
         all_characters.sort(key=lambda character: (character.input_coord.row, character.input_coord.column))
 
         if grouping in (self.CharacterGroup.COLUMN_LEFT_TO_RIGHT, self.CharacterGroup.COLUMN_RIGHT_TO_LEFT):
-            columns = []
-            for column_index in range(self.canvas.right + 1):
-                characters_in_column = [
-                    character for character in all_characters if character.input_coord.column == column_index
-                ]
-                if characters_in_column:
-                    columns.append(characters_in_column)
+            # characters are bucketed into a list indexed by column in a single pass
+            characters_by_column: list[list[EffectCharacter]] = [[] for _ in range(self.canvas.right + 1)]
+            for character in all_characters:
+                if 0 <= character.input_coord.column <= self.canvas.right:
+                    characters_by_column[character.input_coord.column].append(character)
+            columns = [characters_in_column for characters_in_column in characters_by_column if characters_in_column]
             if grouping == self.CharacterGroup.COLUMN_RIGHT_TO_LEFT:
                 columns.reverse()
             return columns
 
         elif grouping in (self.CharacterGroup.ROW_BOTTOM_TO_TOP, self.CharacterGroup.ROW_TOP_TO_BOTTOM):
-            rows = []
-            for row_index in range(self.canvas.top + 1):
-                characters_in_row = [
-                    character for character in all_characters if character.input_coord.row == row_index
-                ]
-                if characters_in_row:
-                    rows.append(characters_in_row)
+            # characters are bucketed into a list indexed by row in a single pass
+            characters_by_row: list[list[EffectCharacter]] = [[] for _ in range(self.canvas.top + 1)]
+            for character in all_characters:
+                if 0 <= character.input_coord.row <= self.canvas.top:
+                    characters_by_row[character.input_coord.row].append(character)
+            rows = [characters_in_row for characters_in_row in characters_by_row if characters_in_row]
             if grouping == self.CharacterGroup.ROW_TOP_TO_BOTTOM:
                 rows.reverse()
             return rows
@@ -635,10 +667,18 @@ class Terminal:
         return output_string
 
     def prep_canvas(self) -> None:
-        """Prepares the terminal for the effect by adding empty lines and hiding the cursor."""
-        sys.stdout.write(ansitools.HIDE_CURSOR())
-        sys.stdout.write(("\n" * (self.canvas.top)))
-        sys.stdout.write(ansitools.DEC_SAVE_CURSOR_POSITION())
+        """Prepares the terminal for the effect by adding empty lines and hiding the cursor.
+
+        The cursor position is saved at the top of the canvas so each frame can be positioned with a
+        single cursor restore sequence.
+        """
+        sys.stdout.write(
+            _HIDE_CURSOR
+            + "\n" * self.canvas.top
+            + ansitools.MOVE_CURSOR_UP(self.canvas.top)
+            + _DEC_SAVE_CURSOR_POSITION
+        )
+        self._last_printed_rows = []
 
     def restore_cursor(self, end_symbol: str = "\n") -> None:
         """Restores the cursor visibility and prints the end_symbol.
@@ -646,8 +686,53 @@ class Terminal:
         Args:
             end_symbol (str, optional): The symbol to print after the effect has completed. Defaults to newline.
         """
-        sys.stdout.write(ansitools.SHOW_CURSOR())
-        sys.stdout.write(end_symbol)
+        sys.stdout.write(_SHOW_CURSOR + end_symbol)
+
+    def _get_changed_rows_output(self, rows: list[str]) -> str:
+        """Get the output required to update the printed canvas to the given rows. Only rows which differ from
+        the previously printed frame are included. Contiguous changed rows are grouped into a single run which is
+        positioned with one cursor movement. The final row is always included so the cursor finishes at the end
+        of the canvas.
+
+        Args:
+            rows (list[str]): rows of the frame to be printed, top to bottom
+
+        Returns:
+            str: the output string including cursor positioning
+        """
+        if len(rows) != len(self._last_printed_rows):
+            return _DEC_RESTORE_CURSOR_POSITION + "\n".join(rows)
+        output_parts: list[str] = []
+        run_start: int | None = None
+        last_row_index = len(rows) - 1
+        for row_index, (row, last_printed_row) in enumerate(zip(rows, self._last_printed_rows)):
+            if row != last_printed_row or row_index == last_row_index:
+                if run_start is None:
+                    run_start = row_index
+                continue
+            if run_start is not None:
+                output_parts.append(self._get_row_run_output(rows, run_start, row_index))
+                run_start = None
+        if run_start is not None:
+            output_parts.append(self._get_row_run_output(rows, run_start, len(rows)))
+        return "".join(output_parts)
+
+    @staticmethod
+    def _get_row_run_output(rows: list[str], start: int, end: int) -> str:
+        """Get the output for a run of contiguous rows, positioned relative to the saved cursor position at the top
+        of the canvas.
+
+        Args:
+            rows (list[str]): rows of the frame, top to bottom
+            start (int): index of the first row in the run
+            end (int): index after the last row in the run
+
+        Returns:
+            str: the output string including cursor positioning
+        """
+        # MOVE_CURSOR_DOWN(0) moves one line in most terminals, so it is only used for an offset
+        cursor_offset = ansitools.MOVE_CURSOR_DOWN(start) if start else ""
+        return _DEC_RESTORE_CURSOR_POSITION + cursor_offset + "\n".join(rows[start:end])
 
     def print(self, output_string: str, *, enforce_frame_rate: bool = True) -> None:
         """Prints the current terminal state to stdout while preserving the cursor position.
@@ -661,12 +746,37 @@ class Terminal:
             If the time since the last print is less than required to limit the frame rate, the method will sleep for the remaining time
             to ensure a consistent animation speed.
 
+            Only the rows which have changed since the previous frame are written. The output for a frame is
+            written and flushed once.
+
         """
         if enforce_frame_rate:
             self.enforce_framerate()
-        self.move_cursor_to_top()
-        sys.stdout.write(output_string)
+        rows = output_string.split("\n")
+        self._write_output(self._get_changed_rows_output(rows))
+        self._last_printed_rows = rows
+
+    @staticmethod
+    def _write_output(output: str) -> None:
+        """Writes the output to stdout and flushes it.
+
+        When stdout is backed by a binary buffer, the output is encoded once and written directly to the buffer,
+        bypassing the text layer. Any text already pending in the text layer is flushed first to preserve ordering.
+        Platforms which translate newlines on output use the text layer.
+
+        Args:
+            output (str): The string to be written.
+        """
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is None or os.linesep != "\n":
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            return
         sys.stdout.flush()
+        encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        errors = getattr(sys.stdout, "errors", None) or "strict"
+        stdout_buffer.write(output.encode(encoding, errors))
+        stdout_buffer.flush()
 
     def enforce_framerate(self):
         """Enforces the frame rate set in the terminal config by sleeping if the time since
@@ -679,5 +789,4 @@ class Terminal:
 
     def move_cursor_to_top(self):
         """Restores the cursor position to the top of the canvas."""
-        sys.stdout.write(ansitools.DEC_RESTORE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.MOVE_CURSOR_UP(self.canvas.top))
+        sys.stdout.write(_DEC_RESTORE_CURSOR_POSITION)
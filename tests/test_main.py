@@ -0,0 +1,44 @@
+import importlib
+import sys
+
+import pytest
+
+from terminaltexteffects.__main__ import get_effect_module_names, parse_args
+
+
+def test_effect_module_names_match_argclass_names():
+    for effect_name, module_name in get_effect_module_names().items():
+        effect_class, args_class = importlib.import_module(module_name).get_effect_and_args()
+        assert args_class.arg_class_metadata.name == effect_name
+
+
+def test_parse_args_effect(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["tte", "rain"])
+    args = parse_args()
+    assert args.arg_class.arg_class_metadata.name == "rain"
+    assert args.input_file is None
+
+
+def test_parse_args_option_value_matches_effect_name(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["tte", "--input-file", "rain", "beams"])
+    args = parse_args()
+    assert args.arg_class.arg_class_metadata.name == "beams"
+    assert args.input_file == "rain"
+
+
+def test_parse_args_unrecognized_argument(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["tte", "rain", "--bogus"])
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args()
+    assert exc_info.value.code == 2
+    assert "unrecognized arguments: --bogus" in capsys.readouterr().err
+
+
+def test_parse_args_help_lists_all_effects(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["tte", "-h"])
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args()
+    assert exc_info.value.code == 0
+    help_output = capsys.readouterr().out
+    for effect_name in get_effect_module_names():
+        assert effect_name in help_output
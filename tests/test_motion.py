@@ -0,0 +1,50 @@
+import pytest
+
+import terminaltexteffects.utils.easing as easing
+from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.utils import geometry
+from terminaltexteffects.utils.geometry import Coord
+
+
+@pytest.fixture
+def character():
+    return EffectCharacter(0, "a", 0, 0)
+
+
+def step_and_check(character, path, steps=None):
+    start = path.origin_segment.start.coord
+    end = path.origin_segment.end.coord
+    while path.current_step < path.max_steps and steps != 0:
+        coord = path.step(character.event_handler)
+        distance_factor = path.ease(path.current_step / path.max_steps)
+        assert path.last_distance_reached == distance_factor * path.total_distance
+        assert coord == geometry.find_coord_on_line(
+            start, end, distance_factor * path.total_distance / path.origin_segment.distance
+        )
+        character.motion.set_coordinate(coord)
+        if steps is not None:
+            steps -= 1
+
+
+def test_path_step_eased_matches_easing_function(character):
+    path = character.motion.new_path(speed=0.5, ease=easing.in_out_sine)
+    path.new_waypoint(Coord(40, 15))
+    character.motion.set_coordinate(Coord(1, 1))
+    character.motion.activate_path(path)
+    step_and_check(character, path)
+    assert path.current_step == path.max_steps
+    assert character.motion.current_coord == Coord(40, 15)
+
+
+def test_path_step_eased_speed_change(character):
+    path = character.motion.new_path(speed=0.5, ease=easing.out_bounce)
+    path.new_waypoint(Coord(40, 15))
+    character.motion.set_coordinate(Coord(1, 1))
+    character.motion.activate_path(path)
+    step_and_check(character, path, steps=20)
+    initial_max_steps = path.max_steps
+    path.speed = 0.25
+    character.motion.activate_path(path)
+    assert path.max_steps != initial_max_steps
+    step_and_check(character, path)
+    assert character.motion.current_coord == Coord(40, 15)
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import sys
+
+import pytest
+
+from terminaltexteffects.engine.terminal import Terminal
+from terminaltexteffects.utils.geometry import Coord
+
+
+def get_printed_bytes(terminal: Terminal, frame: str) -> bytes:
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    with contextlib.redirect_stdout(stdout):
+        terminal.print(frame, enforce_frame_rate=False)
+    stdout.flush()
+    return stdout.buffer.getvalue()
+
+
+@pytest.fixture
+def terminal():
+    return Terminal("abc\ndef\nghi")
+
+
+def test_print_first_frame_full_redraw(terminal):
+    assert get_printed_bytes(terminal, "abc\ndef\nghi") == b"\x1b8abc\ndef\nghi"
+
+
+def test_print_unchanged_frame_rewrites_last_row(terminal):
+    get_printed_bytes(terminal, "abc\ndef\nghi")
+    assert get_printed_bytes(terminal, "abc\ndef\nghi") == b"\x1b8\x1b[2Bghi"
+
+
+def test_print_changed_middle_row(terminal):
+    get_printed_bytes(terminal, "r1\nr2\nr3\nr4\nr5")
+    assert get_printed_bytes(terminal, "r1\nr2\nxx\nr4\nr5") == b"\x1b8\x1b[2Bxx\x1b8\x1b[4Br5"
+
+
+def test_print_changed_row_count_full_redraw(terminal):
+    get_printed_bytes(terminal, "abc\ndef\nghi")
+    assert get_printed_bytes(terminal, "abc\ndef") == b"\x1b8abc\ndef"
+
+
+def test_prep_canvas_resets_printed_rows(terminal):
+    get_printed_bytes(terminal, "abc\ndef\nghi")
+    with contextlib.redirect_stdout(io.StringIO()):
+        terminal.prep_canvas()
+    assert get_printed_bytes(terminal, "abc\ndef\nghi") == b"\x1b8abc\ndef\nghi"
+
+
+def test_get_piped_input_decodes_buffer(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"a\r\nb\xff"), encoding="utf-8"))
+    assert Terminal.get_piped_input() == "a\r\nb\ufffd"
+
+
+def test_get_piped_input_without_buffer(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("a\nb"))
+    assert Terminal.get_piped_input() == "a\nb"
+
+
+@pytest.mark.parametrize(
+    "grouping, expected_symbols",
+    [
+        (Terminal.CharacterGroup.ROW_TOP_TO_BOTTOM, [["a", "b"], ["c", "d"], ["e", "z", "x"]]),
+        (Terminal.CharacterGroup.ROW_BOTTOM_TO_TOP, [["e", "z", "x"], ["c", "d"], ["a", "b"]]),
+        (Terminal.CharacterGroup.COLUMN_LEFT_TO_RIGHT, [["e", "c", "a", "y"], ["z", "d", "b"]]),
+        (Terminal.CharacterGroup.COLUMN_RIGHT_TO_LEFT, [["z", "d", "b"], ["e", "c", "a", "y"]]),
+    ],
+)
+def test_get_characters_grouped_rows_and_columns(grouping, expected_symbols):
+    terminal = Terminal("ab\ncd\ne")
+    # x is outside the canvas columns and y is outside the canvas rows
+    terminal.add_character("x", Coord(5, 1))
+    terminal.add_character("y", Coord(1, 7))
+    terminal.add_character("z", Coord(2, 1))
+    groups = terminal.get_characters_grouped(grouping, added_chars=True)
+    assert [[character.input_symbol for character in group] for group in groups] == expected_symbols